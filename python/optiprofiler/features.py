@@ -1,3 +1,6 @@
+import math
+import operator
+
 import numpy as np
 
 from .utils import FeatureName, FeatureOption, NoiseType
@@ -48,69 +51,26 @@ class Feature:
             raise ValueError(f'Unknown feature: {self._name}.')
 
         # Preprocess the feature options.
-        self._options = {k.lower(): v for k, v in feature_options.items()}
-        for key in self._options:
-            # Check whether the option is known.
-            if key not in FeatureOption.__members__.values():
-                raise ValueError(f'Unknown option: {key}.')
-
-            # Check whether the options are valid for the feature.
-            known_options = [FeatureOption.N_RUNS]
-            if self._name == FeatureName.CUSTOM:
-                known_options.extend([FeatureOption.MODIFIER])
-            elif self._name == FeatureName.NOISY:
-                known_options.extend([FeatureOption.DISTRIBUTION, FeatureOption.TYPE])
-            elif self._name == FeatureName.PERTURBED_X0:
-                known_options.extend([FeatureOption.DISTRIBUTION])
-            elif self._name == FeatureName.RANDOM_NAN:
-                known_options.extend([FeatureOption.RATE_NAN])
-            elif self._name == FeatureName.TRUNCATED:
-                known_options.extend([FeatureOption.PERTURBED_TRAILING_ZEROS, FeatureOption.SIGNIFICANT_DIGITS])
-            elif self._name == FeatureName.UNRELAXABLE_CONSTRAINTS:
-                known_options.extend([FeatureOption.UNRELAXABLE_BOUNDS, FeatureOption.UNRELAXABLE_LINEAR_CONSTRAINTS, FeatureOption.UNRELAXABLE_NONLINEAR_CONSTRAINTS])
-            elif self._name not in [FeatureName.PERMUTED, FeatureName.PLAIN]:
-                raise NotImplementedError(f'Unknown feature: {self._name}.')
-            if key not in known_options:
-                raise ValueError(f'Option {key} is not valid for feature {self._name}.')
-
-            # Check whether the options are valid.
-            if key == FeatureOption.N_RUNS:
-                if isinstance(self._options[key], float) and self._options[key].is_integer():
-                    self._options[key] = int(self._options[key])
-                if not isinstance(self._options[key], int):
-                    raise TypeError(f'Option {key} must be an integer.')
-                if self._options[key] <= 0:
-                    raise ValueError(f'Option {key} must be integer.')
-            elif key == FeatureOption.MODIFIER:
-                if not callable(self._options[key]):
-                    raise TypeError(f'Option {key} must be callable.')
-            elif key == FeatureOption.DISTRIBUTION:
-                if not callable(self._options[key]):
-                    raise TypeError(f'Option {key} must be callable.')
-            elif key == FeatureOption.RATE_NAN:
-                if not isinstance(self._options[key], (int, float)):
-                    raise TypeError(f'Option {key} must be a number.')
-                if not (0.0 <= self._options[key] <= 1.0):
-                    raise ValueError(f'Option {key} must be between 0 and 1.')
-            elif key == FeatureOption.SIGNIFICANT_DIGITS:
-                if isinstance(self._options[key], float) and self._options[key].is_integer():
-                    self._options[key] = int(self._options[key])
-                if not isinstance(self._options[key], int):
-                    raise TypeError(f'Option {key} must be an integer.')
-                if self._options[key] <= 0:
-                    raise ValueError(f'Option {key} must be positive.')
-            elif key == FeatureOption.TYPE:
-                if not isinstance(self._options[key], str):
-                    raise TypeError(f'Option {key} must be a string.')
-                if self._options[key].lower() not in NoiseType.__members__.values():
-                    raise ValueError(f'Option {key} must be either "{NoiseType.ABSOLUTE.value}" or "{NoiseType.RELATIVE.value}".')
-            elif key in [FeatureOption.PERTURBED_TRAILING_ZEROS, FeatureOption.UNRELAXABLE_BOUNDS, FeatureOption.UNRELAXABLE_LINEAR_CONSTRAINTS, FeatureOption.UNRELAXABLE_NONLINEAR_CONSTRAINTS]:
-                if not isinstance(self._options[key], bool):
-                    raise TypeError(f'Option {key} must be a boolean.')
+        if not all(k.islower() for k in feature_options):
+            feature_options = {k.lower(): v for k, v in feature_options.items()}
+        self._options = _validate_options(self._name, feature_options)
 
         # Set default options.
         self._set_default_options()
 
+        # Select the implementation of the modifier once and for all, so that
+        # the modifier does not need to compare the feature name at each call.
+        self._modifier_impl = {
+            FeatureName.CUSTOM.value: self._modify_custom,
+            FeatureName.NOISY.value: self._modify_noisy,
+            FeatureName.PERMUTED.value: self._modify_plain,
+            FeatureName.PLAIN.value: self._modify_plain,
+            FeatureName.PERTURBED_X0.value: self._modify_plain,
+            FeatureName.RANDOM_NAN.value: self._modify_random_nan,
+            FeatureName.TRUNCATED.value: self._modify_truncated,
+            FeatureName.UNRELAXABLE_CONSTRAINTS.value: self._modify_unrelaxable_constraints,
+        }[self._name]
+
     @property
     def name(self):
         """
@@ -188,48 +148,104 @@ class Feature:
             raise TypeError('The argument maxcv_nonlinear must be a float.')
 
         # Preprocess the seed.
-        if seed is not None:
-            if isinstance(seed, float) and seed.is_integer():
-                seed = int(seed)
-            if not isinstance(seed, int):
-                raise TypeError('The argument seed must be an integer.')
-            if seed < 0:
-                raise ValueError('The argument seed must be nonnegative.')
+        seed = _process_seed(seed)
 
         # Modify the objective function value.
-        if self._name == FeatureName.CUSTOM:
-            f = self._options[FeatureOption.MODIFIER](x, f, seed)
-        elif self._name == FeatureName.NOISY:
-            rng = self.get_default_rng(seed, f, sum(ord(letter) for letter in self._options[FeatureOption.TYPE]), *x)
-            if self._options[FeatureOption.TYPE] == NoiseType.ABSOLUTE:
-                f += self._options[FeatureOption.DISTRIBUTION](rng)
-            else:
-                f *= 1.0 + self._options[FeatureOption.DISTRIBUTION](rng)
-        elif self._name == FeatureName.RANDOM_NAN:
-            rng = self.get_default_rng(seed, f, self._options[FeatureOption.RATE_NAN], *x)
-            if rng.uniform() < self._options[FeatureOption.RATE_NAN]:
-                f = np.nan
-        elif self._name == FeatureName.TRUNCATED:
-            rng = self.get_default_rng(seed, f, self._options[FeatureOption.SIGNIFICANT_DIGITS], *x)
-            if f == 0.0:
-                digits = self._options[FeatureOption.SIGNIFICANT_DIGITS] - 1
-            else:
-                digits = self._options[FeatureOption.SIGNIFICANT_DIGITS] - int(np.floor(np.log10(np.abs(f)))) - 1
-            f = round(f, digits)
-            if self._options[FeatureOption.PERTURBED_TRAILING_ZEROS]:
-                if f >= 0.0:
-                    f += rng.uniform(0.0, 10.0 ** (-digits))
-                else:
-                    f -= rng.uniform(0.0, 10.0 ** (-digits))
-        elif self._name == FeatureName.UNRELAXABLE_CONSTRAINTS:
-            if self._options[FeatureOption.UNRELAXABLE_BOUNDS] and maxcv_bounds > 0.0:
-                f = np.inf
-            elif self._options[FeatureOption.UNRELAXABLE_LINEAR_CONSTRAINTS] and maxcv_linear > 0.0:
-                f = np.inf
-            elif self._options[FeatureOption.UNRELAXABLE_NONLINEAR_CONSTRAINTS] and maxcv_nonlinear > 0.0:
-                f = np.inf
-        elif self._name not in [FeatureName.PERMUTED, FeatureName.PLAIN, FeatureName.PERTURBED_X0]:
-            raise NotImplementedError(f'Unknown feature: {self._name}.')
+        return self._modifier_impl(x, f, maxcv_bounds, maxcv_linear, maxcv_nonlinear, seed)
+
+    def modifier_unchecked(self, x, f, maxcv_bounds=0.0, maxcv_linear=0.0, maxcv_nonlinear=0.0, seed=None):
+        """
+        Modify the objective function value according to the feature, without
+        checking the arguments.
+
+        This method is equivalent to `modifier`, but it does not check the
+        arguments. It is meant to be called at each evaluation of the objective
+        function, when the arguments are known to be valid.
+
+        Parameters
+        ----------
+        x : `numpy.ndarray`, shape (n,)
+            Point at which the objective function is evaluated.
+        f : float
+            Objective function value at `x`.
+        maxcv_bounds : float, optional
+            Maximum constraint violation of the bound constraints at `x`.
+        maxcv_linear : float, optional
+            Maximum constraint violation of the linear constraints at `x`.
+        maxcv_nonlinear : float, optional
+            Maximum constraint violation of the nonlinear constraints at `x`.
+        seed : int, optional
+            Nonnegative integer seed used to generate random numbers.
+
+        Returns
+        -------
+        float
+            Modified objective function value.
+        """
+        return self._modifier_impl(x, f, maxcv_bounds, maxcv_linear, maxcv_nonlinear, seed)
+
+    def _modify_plain(self, x, f, maxcv_bounds, maxcv_linear, maxcv_nonlinear, seed):
+        """
+        Modify the objective function value for features that do not modify it.
+        """
+        return f
+
+    def _modify_custom(self, x, f, maxcv_bounds, maxcv_linear, maxcv_nonlinear, seed):
+        """
+        Modify the objective function value for the 'custom' feature.
+        """
+        return self._custom_modifier(x, f, seed)
+
+    def _modify_noisy(self, x, f, maxcv_bounds, maxcv_linear, maxcv_nonlinear, seed):
+        """
+        Modify the objective function value for the 'noisy' feature.
+        """
+        rng = self.get_default_rng(seed, f, self._type_ord_sum, x)
+        if self._is_absolute:
+            f += self._distribution(rng)
+        else:
+            f *= 1.0 + self._distribution(rng)
+        return f
+
+    def _modify_random_nan(self, x, f, maxcv_bounds, maxcv_linear, maxcv_nonlinear, seed):
+        """
+        Modify the objective function value for the 'random_nan' feature.
+        """
+        rng = self.get_default_rng(seed, f, self._rate_nan, x)
+        if rng.random() < self._rate_nan:
+            f = np.nan
+        return f
+
+    def _modify_truncated(self, x, f, maxcv_bounds, maxcv_linear, maxcv_nonlinear, seed):
+        """
+        Modify the objective function value for the 'truncated' feature.
+        """
+        rng = self.get_default_rng(seed, f, self._significant_digits, x)
+        if f == 0.0:
+            digits = self._significant_digits - 1
+        else:
+            digits = self._significant_digits - math.floor(math.log10(abs(f))) - 1
+        f = round(f, digits)
+        if self._perturbed_trailing_zeros:
+            # The trailing zeros are perturbed away from zero.
+            # N.B.: Scaling a draw of Generator.random gives the same values as
+            # Generator.uniform, but it avoids the handling of its bounds.
+            scale = _NEGATIVE_POWERS_OF_TEN.get(digits)
+            if scale is None:
+                scale = 10.0 ** (-digits)
+            f += math.copysign(scale * rng.random(), f)
+        return f
+
+    def _modify_unrelaxable_constraints(self, x, f, maxcv_bounds, maxcv_linear, maxcv_nonlinear, seed):
+        """
+        Modify the objective function value for the 'unrelaxable_constraints' feature.
+        """
+        if self._unrelaxable_bounds and maxcv_bounds > 0.0:
+            f = np.inf
+        elif self._unrelaxable_linear_constraints and maxcv_linear > 0.0:
+            f = np.inf
+        elif self._unrelaxable_nonlinear_constraints and maxcv_nonlinear > 0.0:
+            f = np.inf
         return f
 
     def _set_default_options(self):
@@ -238,8 +254,11 @@ class Feature:
 
         Notes
         -----
-        The default distribution are defined as static methods of the class and
-        not using lambda functions because the latter are not picklable.
+        The default distributions are defined as module-level functions and not
+        using lambda functions because the latter are not picklable.
+
+        The options used by the modifier are also stored as attributes, to
+        avoid looking them up in the options at each evaluation.
         """
 
         if self._name == FeatureName.PLAIN:
@@ -248,18 +267,23 @@ class Feature:
             if FeatureOption.MODIFIER not in self._options:
                 raise ValueError(f'When using a custom feature, you must specify the {FeatureOption.MODIFIER} option.')
             self._options.setdefault(FeatureOption.N_RUNS.value, 1)
+            self._custom_modifier = self._options[FeatureOption.MODIFIER]
         elif self._name == FeatureName.NOISY:
-            self._options.setdefault(FeatureOption.DISTRIBUTION.value, self._default_distribution)
+            self._options.setdefault(FeatureOption.DISTRIBUTION.value, _default_noisy_distribution)
             self._options.setdefault(FeatureOption.N_RUNS.value, 10)
             self._options.setdefault(FeatureOption.TYPE.value, NoiseType.RELATIVE.value)
+            self._distribution = self._options[FeatureOption.DISTRIBUTION]
+            self._type_ord_sum = sum(ord(letter) for letter in self._options[FeatureOption.TYPE])
+            self._is_absolute = self._options[FeatureOption.TYPE] == NoiseType.ABSOLUTE
         elif self._name == FeatureName.PERTURBED_X0:
-            self._options.setdefault(FeatureOption.DISTRIBUTION.value, self._default_distribution)
+            self._options.setdefault(FeatureOption.DISTRIBUTION.value, _default_perturbed_x0_distribution)
             self._options.setdefault(FeatureOption.N_RUNS.value, 10)
         elif self._name == FeatureName.PERMUTED:
             self._options.setdefault(FeatureOption.N_RUNS.value, 10)
         elif self._name == FeatureName.RANDOM_NAN:
             self._options.setdefault(FeatureOption.N_RUNS.value, 10)
             self._options.setdefault(FeatureOption.RATE_NAN.value, 0.05)
+            self._rate_nan = self._options[FeatureOption.RATE_NAN]
         elif self._name == FeatureName.TRUNCATED:
             self._options.setdefault(FeatureOption.PERTURBED_TRAILING_ZEROS.value, True)
             if self._options[FeatureOption.PERTURBED_TRAILING_ZEROS]:
@@ -267,18 +291,19 @@ class Feature:
             else:
                 self._options.setdefault(FeatureOption.N_RUNS.value, 1)
             self._options.setdefault(FeatureOption.SIGNIFICANT_DIGITS.value, 6)
+            self._perturbed_trailing_zeros = self._options[FeatureOption.PERTURBED_TRAILING_ZEROS]
+            self._significant_digits = self._options[FeatureOption.SIGNIFICANT_DIGITS]
         elif self._name == FeatureName.UNRELAXABLE_CONSTRAINTS:
             self._options.setdefault(FeatureOption.N_RUNS.value, 1)
             self._options.setdefault(FeatureOption.UNRELAXABLE_BOUNDS.value, True)
             self._options.setdefault(FeatureOption.UNRELAXABLE_LINEAR_CONSTRAINTS.value, False)
             self._options.setdefault(FeatureOption.UNRELAXABLE_NONLINEAR_CONSTRAINTS.value, False)
+            self._unrelaxable_bounds = self._options[FeatureOption.UNRELAXABLE_BOUNDS]
+            self._unrelaxable_linear_constraints = self._options[FeatureOption.UNRELAXABLE_LINEAR_CONSTRAINTS]
+            self._unrelaxable_nonlinear_constraints = self._options[FeatureOption.UNRELAXABLE_NONLINEAR_CONSTRAINTS]
         else:
             raise NotImplementedError(f'Unknown feature: {self._name}.')
 
-    @staticmethod
-    def _default_distribution(rng, n=None):
-        return 1e-3 * rng.standard_normal(n)
-
     @staticmethod
     def get_default_rng(seed, *args):
         """
@@ -287,9 +312,12 @@ class Feature:
         Parameters
         ----------
         seed : int
-            Seed used to generate an initial random number generator.
-        *args : tuple of int or float
+            Seed used to generate the random number generator. If ``None``,
+            the returned random number generator is not reproducible.
+        *args : tuple of int, float, or `numpy.ndarray`
             Arguments used to generate the returned random number generator.
+            Each argument is either a number or a one-dimensional array of
+            numbers.
 
         Returns
         -------
@@ -297,19 +325,199 @@ class Feature:
             Random number generator.
         """
         # Preprocess the seed.
-        if seed is not None:
-            if isinstance(seed, float) and seed.is_integer():
-                seed = int(seed)
-            if not isinstance(seed, int):
-                raise TypeError('The argument seed must be an integer.')
-            if seed < 0:
-                raise ValueError('The argument seed must be nonnegative.')
-
-        # Preprocess the other arguments.
-        for arg in args:
-            if not isinstance(arg, (int, float)):
-                raise TypeError('The arguments must be numbers.')
-
-        # Generate the random number generator.
-        rng = np.random.default_rng(seed)
-        return np.random.default_rng(int(1e9 * abs(np.sin(1e5 * rng.standard_normal()) + sum(np.sin(1e5 * arg) for arg in args))))
+        seed = _process_seed(seed)
+
+        # Preprocess the other arguments. They are concatenated into a single
+        # array, so that arrays need not be unpacked by the callers.
+        args = [np.atleast_1d(arg) for arg in args]
+        if any(arg.ndim != 1 for arg in args):
+            raise TypeError('The arguments must be numbers or one-dimensional arrays of numbers.')
+        args = np.concatenate(args) if len(args) > 0 else np.empty(0)
+        if args.dtype.kind not in 'biuf':
+            raise TypeError('The arguments must be numbers or one-dimensional arrays of numbers.')
+
+        # Generate the random number generator. The returned generator is
+        # random anyway if no seed is provided.
+        if seed is None:
+            return np.random.default_rng()
+
+        # The seed and the binary representations of the arguments form the
+        # entropy of a seed sequence, which mixes them with a hash function.
+        # N.B.: The arguments are given to the seed sequence as an array of
+        # unsigned 32-bit integers, for which it does not iterate in Python.
+        # The generator is built directly from a PCG64 bit generator, which is
+        # what `numpy.random.default_rng` does after inspecting its argument.
+        seed_sequence = np.random.SeedSequence([seed, args.astype(float).view(np.uint32)])
+        return np.random.Generator(np.random.PCG64(seed_sequence))
+
+
+def _default_noisy_distribution(rng):
+    """
+    Default distribution of the noise used by the 'noisy' feature.
+    """
+    return 1e-3 * rng.standard_normal()
+
+
+def _default_perturbed_x0_distribution(rng, n):
+    """
+    Default distribution of the perturbation used by the 'perturbed_x0' feature.
+    """
+    return 1e-3 * rng.standard_normal(n)
+
+
+def _process_seed(seed):
+    """
+    Preprocess a seed.
+
+    Parameters
+    ----------
+    seed : int or None
+        Seed to preprocess. Integral floating-point numbers are accepted.
+
+    Returns
+    -------
+    int or None
+        Preprocessed seed.
+
+    Raises
+    ------
+    TypeError
+        If the seed is not an integer.
+    ValueError
+        If the seed is negative.
+    """
+    if seed is None:
+        return None
+    try:
+        # N.B.: This accepts the Python and NumPy integers.
+        seed = operator.index(seed)
+    except TypeError:
+        if not (isinstance(seed, float) and seed.is_integer()):
+            raise TypeError('The argument seed must be an integer.') from None
+        seed = int(seed)
+    if seed < 0:
+        raise ValueError('The argument seed must be nonnegative.')
+    return seed
+
+
+def _validate_options(feature_name, options):
+    """
+    Validate the options of a feature.
+
+    Parameters
+    ----------
+    feature_name : str
+        Name of the feature.
+    options : dict
+        Options to validate.
+
+    Returns
+    -------
+    dict
+        Validated options.
+
+    Raises
+    ------
+    TypeError
+        If an option received an invalid value.
+    ValueError
+        If an option is unknown or invalid for the feature.
+    """
+    known_options = _KNOWN_OPTIONS[feature_name]
+    validated_options = {}
+    for key, value in options.items():
+        # Check whether the option is known.
+        if key not in _OPTION_VALIDATORS:
+            raise ValueError(f'Unknown option: {key}.')
+
+        # Check whether the options are valid for the feature.
+        if key not in known_options:
+            raise ValueError(f'Option {key} is not valid for feature {feature_name}.')
+
+        # Check whether the options are valid.
+        validated_options[key] = _OPTION_VALIDATORS[key](key, value)
+    return validated_options
+
+
+def _validate_positive_integer(key, value):
+    """
+    Validate an option that must be a positive integer.
+    """
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if not isinstance(value, int):
+        raise TypeError(f'Option {key} must be an integer.')
+    if value <= 0:
+        raise ValueError(f'Option {key} must be positive.')
+    return value
+
+
+def _validate_callable(key, value):
+    """
+    Validate an option that must be callable.
+    """
+    if not callable(value):
+        raise TypeError(f'Option {key} must be callable.')
+    return value
+
+
+def _validate_rate(key, value):
+    """
+    Validate an option that must be a number between 0 and 1.
+    """
+    if not isinstance(value, (int, float)):
+        raise TypeError(f'Option {key} must be a number.')
+    if not (0.0 <= value <= 1.0):
+        raise ValueError(f'Option {key} must be between 0 and 1.')
+    return value
+
+
+def _validate_noise_type(key, value):
+    """
+    Validate an option that must be a noise type.
+    """
+    if not isinstance(value, str):
+        raise TypeError(f'Option {key} must be a string.')
+    if value.lower() not in NoiseType.__members__.values():
+        raise ValueError(f'Option {key} must be either "{NoiseType.ABSOLUTE.value}" or "{NoiseType.RELATIVE.value}".')
+    return value.lower()
+
+
+def _validate_boolean(key, value):
+    """
+    Validate an option that must be a boolean.
+    """
+    if not isinstance(value, bool):
+        raise TypeError(f'Option {key} must be a boolean.')
+    return value
+
+
+# Options that are valid for each feature.
+_KNOWN_OPTIONS = {
+    FeatureName.CUSTOM.value: frozenset({FeatureOption.N_RUNS.value, FeatureOption.MODIFIER.value}),
+    FeatureName.NOISY.value: frozenset({FeatureOption.N_RUNS.value, FeatureOption.DISTRIBUTION.value, FeatureOption.TYPE.value}),
+    FeatureName.PERMUTED.value: frozenset({FeatureOption.N_RUNS.value}),
+    FeatureName.PLAIN.value: frozenset({FeatureOption.N_RUNS.value}),
+    FeatureName.PERTURBED_X0.value: frozenset({FeatureOption.N_RUNS.value, FeatureOption.DISTRIBUTION.value}),
+    FeatureName.RANDOM_NAN.value: frozenset({FeatureOption.N_RUNS.value, FeatureOption.RATE_NAN.value}),
+    FeatureName.TRUNCATED.value: frozenset({FeatureOption.N_RUNS.value, FeatureOption.PERTURBED_TRAILING_ZEROS.value, FeatureOption.SIGNIFICANT_DIGITS.value}),
+    FeatureName.UNRELAXABLE_CONSTRAINTS.value: frozenset({FeatureOption.N_RUNS.value, FeatureOption.UNRELAXABLE_BOUNDS.value, FeatureOption.UNRELAXABLE_LINEAR_CONSTRAINTS.value, FeatureOption.UNRELAXABLE_NONLINEAR_CONSTRAINTS.value}),
+}
+
+# Validators of each option.
+_OPTION_VALIDATORS = {
+    FeatureOption.DISTRIBUTION.value: _validate_callable,
+    FeatureOption.MODIFIER.value: _validate_callable,
+    FeatureOption.N_RUNS.value: _validate_positive_integer,
+    FeatureOption.PERTURBED_TRAILING_ZEROS.value: _validate_boolean,
+    FeatureOption.RATE_NAN.value: _validate_rate,
+    FeatureOption.SIGNIFICANT_DIGITS.value: _validate_positive_integer,
+    FeatureOption.TYPE.value: _validate_noise_type,
+    FeatureOption.UNRELAXABLE_BOUNDS.value: _validate_boolean,
+    FeatureOption.UNRELAXABLE_LINEAR_CONSTRAINTS.value: _validate_boolean,
+    FeatureOption.UNRELAXABLE_NONLINEAR_CONSTRAINTS.value: _validate_boolean,
+}
+
+# Powers of ten used by the 'truncated' feature, indexed by the opposite of
+# their exponents. They cover the magnitudes of most objective function values.
+_NEGATIVE_POWERS_OF_TEN = {digits: 10.0 ** (-digits) for digits in range(-20, 21)}
@@ -7,7 +7,7 @@ import numpy as np
 from scipy.linalg import lstsq, qr
 from scipy.optimize import Bounds, LinearConstraint, NonlinearConstraint, minimize
 
-from .features import Feature
+from .features import Feature, _process_seed
 from .utils import FeatureName, CUTEstProblemOption, FeatureOption, ProblemError, get_logger
 
 # Options for the CUTEst problems.
@@ -248,7 +248,7 @@ class Problem:
         int
             Dimension of the problem.
         """
-        return self.x0.size
+        return self._x0.size
 
     @property
     def m_linear_ub(self):
@@ -458,13 +458,7 @@ class Problem:
         x = _process_1d_array(x, 'The argument x must be a one-dimensional array.')
         if x.size != self.n:
             raise ValueError(f'The argument x must have size {self.n}.')
-        try:
-            f = self._fun(x)
-        except Exception as err:
-            logger = get_logger(__name__)
-            logger.warning(f'Failed to evaluate the objective function: {err}')
-            f = np.nan
-        return float(f)
+        return self._fun_unchecked(x)
 
     def c_ub(self, x):
         """
@@ -622,12 +616,75 @@ class Problem:
         x = _process_1d_array(x, 'The argument x must be a one-dimensional array.')
         if x.size != self.n:
             raise ValueError(f'The argument x must have size {self.n}.')
-        cv_bounds = np.max(self.lb - x, initial=0.0)
-        cv_bounds = np.max(x - self.ub, initial=cv_bounds)
-        cv_linear = np.max(self.a_ub @ x - self.b_ub, initial=0.0)
-        cv_linear = np.max(np.abs(self.a_eq @ x - self.b_eq), initial=cv_linear)
-        cv_nonlinear = np.max(self.c_ub(x), initial=0.0)
-        cv_nonlinear = np.max(np.abs(self.c_eq(x)), initial=cv_nonlinear)
+        return self._maxcv_unchecked(x)
+
+    def _fun_unchecked(self, x):
+        """
+        Evaluate the objective function, without checking the argument.
+
+        This method is equivalent to `fun`, but the argument `x` must be a
+        one-dimensional array of floating-point numbers of size `n`.
+
+        Parameters
+        ----------
+        x : `numpy.ndarray`, shape (n,)
+            Point at which to evaluate the objective function.
+
+        Returns
+        -------
+        float
+            Value of the objective function at `x`.
+        """
+        try:
+            f = self._fun(x)
+        except Exception as err:
+            logger = get_logger(__name__)
+            logger.warning(f'Failed to evaluate the objective function: {err}')
+            f = np.nan
+        return float(f)
+
+    def _maxcv_unchecked(self, x):
+        """
+        Evaluate the maximum constraint violations, without checking the
+        argument.
+
+        This method is equivalent to `_maxcv`, but the argument `x` must be a
+        one-dimensional array of floating-point numbers of size `n`.
+
+        Parameters
+        ----------
+        x : `numpy.ndarray`, shape (n,)
+            Point at which to evaluate the maximum constraint violation.
+
+        Returns
+        -------
+        float
+            Maximum constraint violation.
+        float
+            Maximum constraint violation for the bound constraints.
+        float
+            Maximum constraint violation for the linear constraints.
+        float
+            Maximum constraint violation for the nonlinear constraints.
+        """
+        # This method is called at each evaluation of the objective function
+        # of a featured problem. The constraints that are not present are
+        # skipped, as NumPy's overhead would dominate the computations.
+        cv_bounds = 0.0
+        if self._lb is not None:
+            cv_bounds = np.max(self.lb - x, initial=cv_bounds)
+        if self._ub is not None:
+            cv_bounds = np.max(x - self.ub, initial=cv_bounds)
+        cv_linear = 0.0
+        if self._b_ub is not None:
+            cv_linear = np.max(self.a_ub @ x - self.b_ub, initial=cv_linear)
+        if self._b_eq is not None:
+            cv_linear = np.max(np.abs(self.a_eq @ x - self.b_eq), initial=cv_linear)
+        cv_nonlinear = 0.0
+        if self._c_ub is not None:
+            cv_nonlinear = np.max(self.c_ub(x), initial=cv_nonlinear)
+        if self._c_eq is not None:
+            cv_nonlinear = np.max(np.abs(self.c_eq(x)), initial=cv_nonlinear)
         cv = max(cv_bounds, cv_linear, cv_nonlinear)
         return cv, cv_bounds, cv_linear, cv_nonlinear
 
@@ -672,20 +729,17 @@ class FeaturedProblem(Problem):
             raise ValueError('The argument max_eval must be positive.')
 
         # Preprocess the seed.
-        self._seed = seed
-        if self._seed is not None:
-            if isinstance(self._seed, float) and self._seed.is_integer():
-                self._seed = int(self._seed)
-            if not isinstance(self._seed, int):
-                raise TypeError('The argument seed must be an integer.')
-            if self._seed < 0:
-                raise ValueError('The argument seed must be nonnegative.')
-
-        # Generate a random permutation.
-        rng = self._feature.get_default_rng(self._seed)
+        self._seed = _process_seed(seed)
+
+        # Generate a random permutation. Its inverse is computed once and for
+        # all, as it is used each time the bounds or the linear constraints are
+        # accessed, i.e., at each evaluation of the objective function.
         self._permutation = None
+        self._permutation_inverse = None
         if feature.name == FeatureName.PERMUTED:
+            rng = self._feature.get_default_rng(self._seed)
             self._permutation = rng.permutation(problem.n)
+            self._permutation_inverse = np.argsort(self._permutation)
 
         # Store the objective function values and maximum constraint violations.
         self._fun_hist = []
@@ -727,9 +781,9 @@ class FeaturedProblem(Problem):
         """
         x0 = super().x0
         if self._feature.name == FeatureName.PERMUTED:
-            x0 = x0[np.argsort(self._permutation)]
+            x0 = x0[self._permutation_inverse]
         elif self._feature.name == FeatureName.PERTURBED_X0:
-            rng = self._feature.get_default_rng(self._seed, *x0)
+            rng = self._feature.get_default_rng(self._seed, x0)
             x0 += self._feature.options[FeatureOption.DISTRIBUTION](rng, x0.size)
         return x0
 
@@ -745,7 +799,7 @@ class FeaturedProblem(Problem):
         """
         lb = super().lb
         if self._feature.name == FeatureName.PERMUTED:
-            lb = lb[np.argsort(self._permutation)]
+            lb = lb[self._permutation_inverse]
         return lb
 
     @property
@@ -760,7 +814,7 @@ class FeaturedProblem(Problem):
         """
         ub = super().ub
         if self._feature.name == FeatureName.PERMUTED:
-            ub = ub[np.argsort(self._permutation)]
+            ub = ub[self._permutation_inverse]
         return ub
 
     @property
@@ -775,7 +829,7 @@ class FeaturedProblem(Problem):
         """
         a_ub = super().a_ub
         if self._feature.name == FeatureName.PERMUTED:
-            a_ub = a_ub[:, np.argsort(self._permutation)]
+            a_ub = a_ub[:, self._permutation_inverse]
         return a_ub
 
     @property
@@ -790,7 +844,7 @@ class FeaturedProblem(Problem):
         """
         a_eq = super().a_eq
         if self._feature.name == FeatureName.PERMUTED:
-            a_eq = a_eq[:, np.argsort(self._permutation)]
+            a_eq = a_eq[:, self._permutation_inverse]
         return a_eq
 
     @property
@@ -840,22 +894,27 @@ class FeaturedProblem(Problem):
         """
         if self.n_eval >= self._max_eval:
             raise StopIteration('The maximum number of function evaluations has been reached.')
+        x = _process_1d_array(x, 'The argument x must be a one-dimensional array.')
+        if x.size != self.n:
+            raise ValueError(f'The argument x must have size {self.n}.')
 
         # Permutate the variables if necessary.
         if self._feature.name == FeatureName.PERMUTED:
             x = x[self._permutation]
 
-        # Evaluate the objective function and store the results.
-        f = super().fun(x)
-        maxcv, maxcv_bounds, maxcv_linear, maxcv_nonlinear = self._maxcv(x)
+        # Evaluate the objective function and store the results. The argument x
+        # has already been processed, so that it is not processed again.
+        f = self._fun_unchecked(x)
+        maxcv, maxcv_bounds, maxcv_linear, maxcv_nonlinear = self._maxcv_unchecked(x)
         self._fun_hist.append(f)
         self._maxcv_hist.append(maxcv)
 
         # Modified the objective function value according to the feature and
         # return the modified value. We should not store the modified value
         # because the performance of an optimization solver should be measured
-        # using the original objective function.
-        return self._feature.modifier(x, f, maxcv_bounds, maxcv_linear, maxcv_nonlinear, self._seed)
+        # using the original objective function. The arguments of the modifier
+        # are valid by construction, so that they need not be checked.
+        return self._feature.modifier_unchecked(x, f, maxcv_bounds, maxcv_linear, maxcv_nonlinear, self._seed)
 
     def c_ub(self, x):
         """
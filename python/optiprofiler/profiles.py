@@ -1,10 +1,10 @@
+import atexit
 import os
-import re
 import shutil
 import time
 import warnings
-from contextlib import redirect_stderr, redirect_stdout
-from datetime import datetime
+from contextlib import nullcontext, redirect_stderr, redirect_stdout
+from functools import lru_cache
 from inspect import signature
 from multiprocessing import Pool
 from pathlib import Path
@@ -113,6 +113,13 @@ def run_benchmark(solvers, labels=(), cutest_problem_names=(), custom_problem_lo
     project_x0 : bool, optional
         Whether to project the initial points of all the problems included in
         the benchmark onto their feasible set.
+    plain_compare_policy : str, optional
+        Only used for stochastic features. Which problems are also solved
+        without any feature, so that the least merit values used in the
+        convergence tests account for the plain runs. Available policies are
+        ``'all'`` (all the problems, the default), ``'unsolved'`` (only the
+        problems on which no finite merit value is reached with the feature),
+        and ``'none'`` (none of the problems).
     n_runs : int, optional
         Number of runs to perform for each solver on each problem.
     distribution : callable, optional
@@ -192,6 +199,12 @@ def run_benchmark(solvers, labels=(), cutest_problem_names=(), custom_problem_lo
     if len(solvers) < 2:
         raise ValueError('At least two solvers must be given.')
     solvers = list(solvers)
+    solver_n_args = []
+    for solver in solvers:
+        sig = signature(solver)
+        if len(sig.parameters) not in [1, 2, 4, 8, 10]:
+            raise ValueError(f'Unknown signature: {sig}.')
+        solver_n_args.append(len(sig.parameters))
 
     # Preprocess the labels.
     if not hasattr(labels, '__len__') or not all(isinstance(label, str) for label in labels):
@@ -229,9 +242,9 @@ def run_benchmark(solvers, labels=(), cutest_problem_names=(), custom_problem_lo
     feature_options = {}
     profile_options = {}
     for key, value in kwargs.items():
-        if key in FeatureOption.__members__.values():
+        if key in _FEATURE_OPTIONS:
             feature_options[key] = value
-        elif key in ProfileOption.__members__.values():
+        elif key in _PROFILE_OPTIONS:
             profile_options[key] = value
         else:
             raise ValueError(f'Unknown option: {key}.')
@@ -240,6 +253,7 @@ def run_benchmark(solvers, labels=(), cutest_problem_names=(), custom_problem_lo
     profile_options.setdefault(ProfileOption.N_JOBS.value, None)
     profile_options.setdefault(ProfileOption.BENCHMARK_ID.value, '.')
     profile_options.setdefault(ProfileOption.PROJECT_X0.value, False)
+    profile_options.setdefault(ProfileOption.PLAIN_COMPARE_POLICY.value, 'all')
 
     # Check whether the profile options are valid.
     if isinstance(profile_options[ProfileOption.N_JOBS], float) and profile_options[ProfileOption.N_JOBS].is_integer():
@@ -250,6 +264,11 @@ def run_benchmark(solvers, labels=(), cutest_problem_names=(), custom_problem_lo
         raise TypeError(f'Option {ProfileOption.BENCHMARK_ID} must be a string.')
     if not isinstance(profile_options[ProfileOption.PROJECT_X0], bool):
         raise TypeError(f'Option {ProfileOption.PROJECT_X0} must be a boolean.')
+    if not isinstance(profile_options[ProfileOption.PLAIN_COMPARE_POLICY], str):
+        raise TypeError(f'Option {ProfileOption.PLAIN_COMPARE_POLICY} must be a string.')
+    profile_options[ProfileOption.PLAIN_COMPARE_POLICY] = profile_options[ProfileOption.PLAIN_COMPARE_POLICY].lower()
+    if profile_options[ProfileOption.PLAIN_COMPARE_POLICY] not in ['all', 'unsolved', 'none']:
+        raise ValueError(f"Option {ProfileOption.PLAIN_COMPARE_POLICY} must be 'all', 'unsolved', or 'none'.")
 
     # Build the features.
     if isinstance(feature_name, str):
@@ -258,7 +277,7 @@ def run_benchmark(solvers, labels=(), cutest_problem_names=(), custom_problem_lo
     features = [Feature(name, **feature_options) for name in feature_name]
 
     # Path to the summary.
-    timestamp = datetime.now().astimezone().strftime('%Y-%m-%dT%H-%M-%S%Z')
+    timestamp = time.strftime('%Y-%m-%dT%H-%M-%S%Z')
     path_out = Path('out', profile_options[ProfileOption.BENCHMARK_ID], timestamp).resolve()
     path_summary = path_out / 'summary.pdf'
 
@@ -298,202 +317,294 @@ def run_benchmark(solvers, labels=(), cutest_problem_names=(), custom_problem_lo
     }
 
     # Run the benchmarks.
+    benchmark_problem_names = cutest_problem_names + [(f'EXTRA{i_problem}', custom_problem_name) for i_problem, custom_problem_name in enumerate(custom_problem_names)]
     pdf_summary = backend_pdf.PdfPages(path_summary)
     problem_names = None
     merit_init = None
     merit_histories_plain = None
     merit_out_plain = None
-    for feature in features:
-        # Solve the problems.
-        logger.info(f'Starting the computations of the "{feature.name}" profiles.')
-        max_eval_factor = 500
-        if feature.name == FeatureName.PLAIN and merit_histories_plain is not None:
-            merit_histories = np.copy(merit_histories_plain)
-            merit_out = np.copy(merit_out_plain)
-        else:
-            problem_names, fun_histories, maxcv_histories, fun_out, maxcv_out, fun_init, maxcv_init, n_eval, problem_dimensions, time_processes = _solve_all_problems(cutest_problem_names, custom_problem_loader, custom_problem_names, solvers, labels, feature, max_eval_factor, profile_options)
-            merit_histories = _compute_merit_values(fun_histories, maxcv_histories, maxcv_init)
-            merit_out = _compute_merit_values(fun_out, maxcv_out, maxcv_init)
-            merit_init = _compute_merit_values(fun_init, maxcv_init, maxcv_init)
-            if feature.name == FeatureName.PLAIN:
-                merit_histories_plain = np.copy(merit_histories)
-                merit_out_plain = np.copy(merit_out)
-
-        # Determine the least merit value for each problem.
-        merit_min = np.min(merit_histories, (1, 2, 3))
-        if feature.is_stochastic:
-            if merit_histories_plain is None:
-                feature_plain = Feature('plain')
-                logger.info(f'Starting the computations of the "plain" profiles.')
-                problem_names, fun_histories_plain, maxcv_histories_plain, fun_out_plain, maxcv_out_plain, fun_init, maxcv_init, _, _, time_processes_plain = _solve_all_problems(cutest_problem_names, custom_problem_loader, custom_problem_names, solvers, labels, feature_plain, max_eval_factor, profile_options)
-                merit_histories_plain = _compute_merit_values(fun_histories_plain, maxcv_histories_plain, maxcv_init)
-                merit_out_plain = _compute_merit_values(fun_out_plain, maxcv_out_plain, maxcv_init)
-                merit_init = _compute_merit_values(fun_init, maxcv_init, maxcv_init)
-            merit_min_plain = np.min(merit_histories_plain, (1, 2, 3))
-            merit_min = np.minimum(merit_min, merit_min_plain)
-
-        # Paths to the individual results.
-        path_feature = path_out / feature.name
-        path_feature.mkdir(parents=True, exist_ok=True)
-        path_problems = path_feature / 'problems.txt'
-        path_perf_hist = path_feature / 'perf_hist.pdf'
-        path_perf_out = path_feature / 'perf_out.pdf'
-        path_data_hist = path_feature / 'data_hist.pdf'
-        path_data_out = path_feature / 'data_out.pdf'
-        path_log_ratio_hist = path_feature / 'log-ratio_hist.pdf'
-        path_log_ratio_out = path_feature / 'log-ratio_out.pdf'
-
-        # Store the names of the problems.
-        with path_problems.open('w') as f:
-            f.write(os.linesep.join(problem_names))
-
-        with plt.rc_context(profile_context):
-            # Create the summary figure.
-            fig_summary = plt.figure(figsize=(len(tolerances) * 4.8, 4 * 4.8), layout='constrained')
-            subfig_summary = fig_summary.subfigures(2, 1)
-            ax_summary_hist = subfig_summary[0].subplots(2, len(tolerances), sharey=True)
-            ax_summary_out = subfig_summary[1].subplots(2, len(tolerances), sharey=True)
-
-            # Create the performance and data profiles.
-            n_problems, n_solvers, n_runs, max_eval = merit_histories.shape
-            pdf_perf_hist = backend_pdf.PdfPages(path_perf_hist)
-            pdf_perf_out = backend_pdf.PdfPages(path_perf_out)
-            pdf_data_hist = backend_pdf.PdfPages(path_data_hist)
-            pdf_data_out = backend_pdf.PdfPages(path_data_out)
-            pdf_log_ratio_hist = backend_pdf.PdfPages(path_log_ratio_hist, False)
-            pdf_log_ratio_out = backend_pdf.PdfPages(path_log_ratio_out, False)
-            for i_tolerance, tolerance in enumerate(tolerances):
-                tolerance_str, tolerance_latex = _format_float_scientific_latex(tolerance)
-                logger.info(f'Creating profiles for tolerance {tolerance_str}.')
-                tolerance_label = f'($\\mathrm{{tol}} = {tolerance_latex}$)'
-
-                # Compute the number of function evaluations used by each
-                # solver on each problem at each run to achieve convergence.
-                work_hist = np.full((n_problems, n_solvers, n_runs), np.nan)
-                work_out = np.full((n_problems, n_solvers, n_runs), np.nan)
-                for i_problem in range(n_problems):
-                    for i_solver in range(n_solvers):
-                        for i_run in range(n_runs):
-                            if np.isfinite(merit_min[i_problem]):
-                                threshold = max(tolerance * merit_init[i_problem] + (1.0 - tolerance) * merit_min[i_problem], merit_min[i_problem])
-                            else:
-                                threshold = -np.inf
-                            if np.min(merit_histories[i_problem, i_solver, i_run, :]) <= threshold:
-                                work_hist[i_problem, i_solver, i_run] = np.argmax(merit_histories[i_problem, i_solver, i_run, :] <= threshold) + 1
-                            if merit_out[i_problem, i_solver, i_run] <= threshold:
-                                work_out[i_problem, i_solver, i_run] = n_eval[i_problem, i_solver, i_run]
-
-                # Draw and save the profiles.
-                fig_perf_hist, fig_perf_out, fig_data_hist, fig_data_out, fig_log_ratio_hist, fig_log_ratio_out = _draw_profiles(work_hist, work_out, problem_dimensions, labels, tolerance_label, i_tolerance, ax_summary_hist, ax_summary_out)
-                pdf_perf_hist.savefig(fig_perf_hist, bbox_inches='tight')
-                pdf_perf_out.savefig(fig_perf_out, bbox_inches='tight')
-                pdf_data_hist.savefig(fig_data_hist, bbox_inches='tight')
-                pdf_data_out.savefig(fig_data_out, bbox_inches='tight')
-                if fig_log_ratio_hist is not None:
-                    pdf_log_ratio_hist.savefig(fig_log_ratio_hist, bbox_inches='tight')
-                if fig_log_ratio_out is not None:
-                    pdf_log_ratio_out.savefig(fig_log_ratio_out, bbox_inches='tight')
-
-                # Close the individual figures.
-                plt.close(fig_perf_hist)
-                plt.close(fig_perf_out)
-                plt.close(fig_data_hist)
-                plt.close(fig_data_out)
-                if fig_log_ratio_hist is not None:
-                    plt.close(fig_log_ratio_hist)
-                if fig_log_ratio_out is not None:
-                    plt.close(fig_log_ratio_out)
-
-            # Close the individual PDF files.
-            pdf_perf_hist.close()
-            pdf_perf_out.close()
-            pdf_data_hist.close()
-            pdf_data_out.close()
-            pdf_log_ratio_hist.close()
-            pdf_log_ratio_out.close()
-            logger.info(f'Detailed results stored in {path_feature}.')
-
-            # Save the summary for the current feature.
-            subfig_summary[0].supylabel('History-based profiles', fontsize='xx-large', horizontalalignment='right')
-            subfig_summary[1].supylabel('Output-based profiles', fontsize='xx-large', horizontalalignment='right')
-            fig_summary.suptitle(f"Profiles with the ``{feature.name}'' feature", fontsize='xx-large', verticalalignment='bottom')
-            pdf_summary.savefig(fig_summary, bbox_inches='tight')
-
-            # Close the summary figure.
-            plt.close(fig_summary)
+    merit_init_plain = None
+    n_eval_plain = None
+    problem_dimensions_plain = None
+
+    # The same pool of workers is used for all the computations, to avoid
+    # starting new processes each time the problems are solved. No more workers
+    # than runs of the solvers on the problems are started, and the problems are
+    # solved sequentially if at most one worker would be used.
+    n_runs_max = max(feature.options[FeatureOption.N_RUNS] for feature in features)
+    n_workers = min(profile_options[ProfileOption.N_JOBS] or os.cpu_count() or 1, len(benchmark_problem_names) * len(solvers) * n_runs_max)
+    if n_workers <= 1 or os.cpu_count() == 1:
+        pool = nullcontext()
+    else:
+        pool = Pool(n_workers)
+    try:
+        with pool as pool:
+            for feature in features:
+                # Solve the problems.
+                logger.info(f'Starting the computations of the "{feature.name}" profiles.')
+                max_eval_factor = 500
+                if feature.name == FeatureName.PLAIN and merit_histories_plain is not None:
+                    merit_histories = list(merit_histories_plain)
+                    merit_out = np.copy(merit_out_plain)
+                    merit_init = np.copy(merit_init_plain)
+                    n_eval = np.copy(n_eval_plain)
+                    problem_dimensions = np.copy(problem_dimensions_plain)
+                else:
+                    problem_names, fun_histories, maxcv_histories, fun_out, maxcv_out, fun_init, maxcv_init, n_eval, problem_dimensions, time_processes = _solve_all_problems(benchmark_problem_names, custom_problem_loader, solvers, solver_n_args, labels, feature, max_eval_factor, profile_options, pool)
+                    merit_histories = [_compute_merit_values(fun_hist, maxcv_hist, maxcv_init_problem) for fun_hist, maxcv_hist, maxcv_init_problem in zip(fun_histories, maxcv_histories, maxcv_init)]
+                    merit_out = _compute_merit_values(fun_out, maxcv_out, maxcv_init)
+                    merit_init = _compute_merit_values(fun_init, maxcv_init, maxcv_init)
+                    if feature.name == FeatureName.PLAIN:
+                        merit_histories_plain = list(merit_histories)
+                        merit_out_plain = np.copy(merit_out)
+                        merit_init_plain = np.copy(merit_init)
+                        n_eval_plain = np.copy(n_eval)
+                        problem_dimensions_plain = np.copy(problem_dimensions)
+
+                # Determine the least merit value for each problem.
+                merit_min = np.array([np.min(merit_hist, initial=np.inf) for merit_hist in merit_histories])
+                if feature.is_stochastic and profile_options[ProfileOption.PLAIN_COMPARE_POLICY] != 'none':
+                    if merit_histories_plain is None and profile_options[ProfileOption.PLAIN_COMPARE_POLICY] == 'all':
+                        feature_plain = Feature('plain')
+                        logger.info(f'Starting the computations of the "plain" profiles.')
+                        problem_names, fun_histories_plain, maxcv_histories_plain, fun_out_plain, maxcv_out_plain, fun_init, maxcv_init, n_eval_plain, problem_dimensions_plain, time_processes_plain = _solve_all_problems(benchmark_problem_names, custom_problem_loader, solvers, solver_n_args, labels, feature_plain, max_eval_factor, profile_options, pool)
+                        merit_histories_plain = [_compute_merit_values(fun_hist, maxcv_hist, maxcv_init_problem) for fun_hist, maxcv_hist, maxcv_init_problem in zip(fun_histories_plain, maxcv_histories_plain, maxcv_init)]
+                        merit_out_plain = _compute_merit_values(fun_out_plain, maxcv_out_plain, maxcv_init)
+                        merit_init = _compute_merit_values(fun_init, maxcv_init, maxcv_init)
+                        merit_init_plain = np.copy(merit_init)
+                    if merit_histories_plain is not None:
+                        merit_min_plain = np.array([np.min(merit_hist, initial=np.inf) for merit_hist in merit_histories_plain])
+                    else:
+                        # Only the problems on which no finite merit value is
+                        # reached with the feature are solved without it. The
+                        # plain results are then incomplete, and are not stored.
+                        merit_min_plain = np.full(merit_min.size, np.inf)
+                        problem_names_unsolved = {problem_names[i_problem] for i_problem in np.flatnonzero(~np.isfinite(merit_min))}
+                        if len(problem_names_unsolved) > 0:
+                            feature_plain = Feature('plain')
+                            logger.info(f'Starting the computations of the "plain" profiles on {len(problem_names_unsolved)} problem(s).')
+                            problem_names_plain, fun_histories_plain, maxcv_histories_plain, _, _, _, maxcv_init_plain, _, _, _ = _solve_all_problems([problem_name for problem_name in benchmark_problem_names if (problem_name[0] if isinstance(problem_name, tuple) else problem_name) in problem_names_unsolved], custom_problem_loader, solvers, solver_n_args, labels, feature_plain, max_eval_factor, profile_options, pool)
+                            i_problems = {problem_name: i_problem for i_problem, problem_name in enumerate(problem_names)}
+                            for problem_name, fun_hist, maxcv_hist, maxcv_init_problem in zip(problem_names_plain, fun_histories_plain, maxcv_histories_plain, maxcv_init_plain):
+                                merit_min_plain[i_problems[problem_name]] = np.min(_compute_merit_values(fun_hist, maxcv_hist, maxcv_init_problem), initial=np.inf)
+                    merit_min = np.minimum(merit_min, merit_min_plain)
+
+                # Paths to the individual results.
+                path_feature = path_out / feature.name
+                path_feature.mkdir(parents=True, exist_ok=True)
+                path_problems = path_feature / 'problems.txt'
+                path_perf_hist = path_feature / 'perf_hist.pdf'
+                path_perf_out = path_feature / 'perf_out.pdf'
+                path_data_hist = path_feature / 'data_hist.pdf'
+                path_data_out = path_feature / 'data_out.pdf'
+                path_log_ratio_hist = path_feature / 'log-ratio_hist.pdf'
+                path_log_ratio_out = path_feature / 'log-ratio_out.pdf'
+
+                # Store the names of the problems.
+                with path_problems.open('w') as f:
+                    f.writelines(f'{problem_name}\n' for problem_name in problem_names)
+
+                with plt.rc_context(profile_context):
+                    # Create the summary figure.
+                    fig_summary = plt.figure(figsize=(len(tolerances) * 4.8, 4 * 4.8), layout='constrained')
+                    subfig_summary = fig_summary.subfigures(2, 1)
+                    ax_summary_hist = subfig_summary[0].subplots(2, len(tolerances), sharey=True)
+                    ax_summary_out = subfig_summary[1].subplots(2, len(tolerances), sharey=True)
+
+                    # Create the performance and data profiles.
+                    n_problems, n_solvers, n_runs = merit_out.shape
+
+                    # Compute the number of function evaluations used by each
+                    # solver on each problem at each run to achieve convergence,
+                    # for all the tolerances at once.
+                    is_finite = np.isfinite(merit_min)
+                    thresholds = np.full((tolerances.size, n_problems), -np.inf)
+                    thresholds[:, is_finite] = np.maximum(tolerances[:, np.newaxis] * merit_init[is_finite] + (1.0 - tolerances[:, np.newaxis]) * merit_min[is_finite], merit_min[is_finite])
+                    works_hist = np.full((tolerances.size, n_problems, n_solvers, n_runs), np.nan)
+                    for i_problem, merit_hist in enumerate(merit_histories):
+                        # The convergence tests are made on the running minimum of
+                        # the merit values, which is nonincreasing. Hence, the
+                        # number of function evaluations needed to achieve
+                        # convergence is one more than the number of evaluations at
+                        # which the test fails, and the problem is solved if and
+                        # only if the test holds at the last evaluation.
+                        merit_running_min = np.minimum.accumulate(merit_hist, 2)
+                        n_unconverged = np.count_nonzero(merit_running_min > thresholds[:, i_problem, np.newaxis, np.newaxis, np.newaxis], 3)
+                        is_solved_hist = n_unconverged < merit_hist.shape[2]
+                        works_hist[:, i_problem][is_solved_hist] = n_unconverged[is_solved_hist] + 1
+                    is_solved_out = merit_out <= thresholds[:, :, np.newaxis, np.newaxis]
+                    works_out = np.where(is_solved_out, n_eval, np.nan)
+
+                    # Open the individual PDF files.
+                    pdf_perf_hist = backend_pdf.PdfPages(path_perf_hist)
+                    pdf_perf_out = backend_pdf.PdfPages(path_perf_out)
+                    pdf_data_hist = backend_pdf.PdfPages(path_data_hist)
+                    pdf_data_out = backend_pdf.PdfPages(path_data_out)
+                    pdf_log_ratio_hist = backend_pdf.PdfPages(path_log_ratio_hist, False)
+                    pdf_log_ratio_out = backend_pdf.PdfPages(path_log_ratio_out, False)
+                    for i_tolerance, tolerance in enumerate(tolerances):
+                        tolerance_str, tolerance_latex = _format_float_scientific_latex(tolerance)
+                        logger.info(f'Creating profiles for tolerance {tolerance_str}.')
+                        tolerance_label = f'($\\mathrm{{tol}} = {tolerance_latex}$)'
+
+                        # Draw and save the profiles.
+                        fig_perf_hist, fig_perf_out, fig_data_hist, fig_data_out, fig_log_ratio_hist, fig_log_ratio_out = _draw_profiles(works_hist[i_tolerance], works_out[i_tolerance], problem_dimensions, labels, tolerance_label, i_tolerance, ax_summary_hist, ax_summary_out)
+                        pdf_perf_hist.savefig(fig_perf_hist, bbox_inches='tight')
+                        pdf_perf_out.savefig(fig_perf_out, bbox_inches='tight')
+                        pdf_data_hist.savefig(fig_data_hist, bbox_inches='tight')
+                        pdf_data_out.savefig(fig_data_out, bbox_inches='tight')
+                        if fig_log_ratio_hist is not None:
+                            pdf_log_ratio_hist.savefig(fig_log_ratio_hist, bbox_inches='tight')
+                        if fig_log_ratio_out is not None:
+                            pdf_log_ratio_out.savefig(fig_log_ratio_out, bbox_inches='tight')
+
+                        # Close the individual figures.
+                        plt.close(fig_perf_hist)
+                        plt.close(fig_perf_out)
+                        plt.close(fig_data_hist)
+                        plt.close(fig_data_out)
+                        if fig_log_ratio_hist is not None:
+                            plt.close(fig_log_ratio_hist)
+                        if fig_log_ratio_out is not None:
+                            plt.close(fig_log_ratio_out)
+
+                    # Close the individual PDF files.
+                    pdf_perf_hist.close()
+                    pdf_perf_out.close()
+                    pdf_data_hist.close()
+                    pdf_data_out.close()
+                    pdf_log_ratio_hist.close()
+                    pdf_log_ratio_out.close()
+                    logger.info(f'Detailed results stored in {path_feature}.')
+
+                    # Save the summary for the current feature.
+                    subfig_summary[0].supylabel('History-based profiles', fontsize='xx-large', horizontalalignment='right')
+                    subfig_summary[1].supylabel('Output-based profiles', fontsize='xx-large', horizontalalignment='right')
+                    fig_summary.suptitle(f"Profiles with the ``{feature.name}'' feature", fontsize='xx-large', verticalalignment='bottom')
+                    pdf_summary.savefig(fig_summary, bbox_inches='tight')
+
+                    # Close the summary figure.
+                    plt.close(fig_summary)
+    finally:
+        # Release the problems cached in the current process, which is the case
+        # if the problems are solved sequentially, even if an error occurred.
+        _loaded_problems.clear()
 
     # Close the summary PDF file.
     pdf_summary.close()
     logger.info(f'Summary stored in {path_summary}.')
 
 
-def _solve_all_problems(cutest_problem_names, custom_problem_loader, custom_problem_names, solvers, labels, feature, max_eval_factor, profile_options):
+def _solve_all_problems(problem_names, custom_problem_loader, solvers, solver_n_args, labels, feature, max_eval_factor, profile_options, pool):
     """
-    Solve all problems in parallel.
+    Solve the given problems in parallel.
+
+    The names of the custom problems must be given as tuples, whose first
+    elements are the names of the problems and whose second elements are given
+    to the custom problem loader.
+
+    The problems are first loaded, each by a single task, to evaluate the
+    functions at their initial points. Each run of each solver on each loaded
+    problem is then a task on its own, so that the workers are kept busy even
+    if there are few problems. The problems are solved sequentially if no pool
+    of workers is provided.
     """
-    problem_names = cutest_problem_names + [(f'EXTRA{i_problem}', custom_problem_name) for i_problem, custom_problem_name in enumerate(custom_problem_names)]
-    cutest_problem_options = get_cutest_problem_options()
+    cutest_problem_options = tuple(sorted(get_cutest_problem_options().items()))
+    project_x0 = profile_options[ProfileOption.PROJECT_X0]
+    n_solvers = len(solvers)
+    n_runs = feature.options[FeatureOption.N_RUNS]
 
-    # Solve all problems.
+    # Load all problems. N.B.: A CUTEst problem must not be loaded concurrently
+    # for the first time, so that it is not compiled concurrently.
     logger = get_logger(__name__)
     logger.info('Entering the parallel section.')
-    args = [(problem_name, solvers, labels, feature, max_eval_factor, custom_problem_loader, cutest_problem_options, profile_options) for problem_name in problem_names]
-    if profile_options[ProfileOption.N_JOBS] == 1 or os.cpu_count() == 1:
-        results = map(lambda arg: _solve_one_problem(*arg), args)
+    args = [(problem_name, custom_problem_loader, cutest_problem_options, project_x0) for problem_name in problem_names]
+    if pool is None:
+        results = [_evaluate_initial_point(*arg) for arg in args]
+    else:
+        results = pool.starmap(_evaluate_initial_point, args)
+
+    # Solve all the loaded problems.
+    problem_names = [problem_name for problem_name, result in zip(problem_names, results) if result is not None]
+    results = [result for result in results if result is not None]
+    args = [(problem_name, solvers, solver_n_args, labels, feature, max_eval_factor, custom_problem_loader, cutest_problem_options, project_x0, i_solver, i_run) for problem_name in problem_names for i_solver in range(n_solvers) for i_run in range(n_runs)]
+    if pool is None:
+        results_runs = [_solve_one_run(*arg) for arg in args]
     else:
-        with Pool(profile_options[ProfileOption.N_JOBS]) as p:
-            results = p.starmap(_solve_one_problem, args)
+        results_runs = pool.starmap(_solve_one_run, args)
     logger.info('Leaving the parallel section.')
-    if all(result is None for result in results):
+
+    # Collect the results of the problems that could be loaded. The histories
+    # are not stacked into a single array, because their lengths depend on the
+    # dimensions of the problems.
+    problem_names = []
+    fun_histories, maxcv_histories = [], []
+    fun_out, maxcv_out = [], []
+    fun_init, maxcv_init = [], []
+    n_eval = []
+    problem_dimensions = []
+    time_processes = []
+    for i_problem, (problem_name, fun_init_problem, maxcv_init_problem, problem_dimension) in enumerate(results):
+        max_eval = max_eval_factor * problem_dimension
+        results_problem = results_runs[i_problem * n_solvers * n_runs:(i_problem + 1) * n_solvers * n_runs]
+        problem_names.append(problem_name)
+        fun_histories.append(np.reshape([result[0] for result in results_problem], (n_solvers, n_runs, max_eval)))
+        maxcv_histories.append(np.reshape([result[1] for result in results_problem], (n_solvers, n_runs, max_eval)))
+        fun_out.append(np.reshape([result[2] for result in results_problem], (n_solvers, n_runs)))
+        maxcv_out.append(np.reshape([result[3] for result in results_problem], (n_solvers, n_runs)))
+        fun_init.append(fun_init_problem)
+        maxcv_init.append(maxcv_init_problem)
+        n_eval.append(np.reshape([result[4] for result in results_problem], (n_solvers, n_runs)))
+        problem_dimensions.append(problem_dimension)
+        time_processes.append(sum(result[5] for result in results_problem))
+    if len(problem_names) == 0:
         logger.critical('All problems failed to load.')
-        problem_names = []
-        _fun_histories, _maxcv_histories = [], []
-        fun_out, maxcv_out = [], []
-        fun_init, maxcv_init = [], []
-        n_eval = []
-        problem_dimensions = []
-        time_processes = []
-    else:
-        problem_names, _fun_histories, _maxcv_histories, fun_out, maxcv_out, fun_init, maxcv_init, n_eval, problem_dimensions, time_processes = zip(*[result for result in results if result is not None])
-    fun_out = np.array(fun_out)
-    maxcv_out = np.array(maxcv_out)
+    # The shapes are given explicitly so that they are correct even if no
+    # problem could be loaded.
+    fun_out = np.reshape(np.array(fun_out, dtype=float), (-1, n_solvers, n_runs))
+    maxcv_out = np.reshape(np.array(maxcv_out, dtype=float), (-1, n_solvers, n_runs))
     fun_init = np.array(fun_init)
     maxcv_init = np.array(maxcv_init)
-    n_eval = np.array(n_eval)
+    n_eval = np.reshape(np.array(n_eval, dtype=int), (-1, n_solvers, n_runs))
     problem_dimensions = np.array(problem_dimensions)
     time_processes = np.array(time_processes)
-
-    # Build the results.
-    n_problems = len(problem_names)
-    n_solvers = len(solvers)
-    n_runs = feature.options[FeatureOption.N_RUNS]
-    max_eval = max_eval_factor * np.max(problem_dimensions) if problem_dimensions.size > 0 else 1
-    fun_histories = np.full((n_problems, n_solvers, n_runs, max_eval), np.nan)
-    maxcv_histories = np.full((n_problems, n_solvers, n_runs, max_eval), np.nan)
-    for i_problem, (fun_hist, maxcv_hist) in enumerate(zip(_fun_histories, _maxcv_histories)):
-        max_eval = max_eval_factor * problem_dimensions[i_problem]
-        fun_histories[i_problem, ..., :max_eval] = fun_hist
-        maxcv_histories[i_problem, ..., :max_eval] = maxcv_hist
-        if max_eval > 0:
-            fun_histories[i_problem, ..., max_eval:] = fun_histories[i_problem, ..., max_eval - 1, np.newaxis]
-            maxcv_histories[i_problem, ..., max_eval:] = maxcv_histories[i_problem, ..., max_eval - 1, np.newaxis]
     return problem_names, fun_histories, maxcv_histories, fun_out, maxcv_out, fun_init, maxcv_init, n_eval, problem_dimensions, time_processes
 
 
-def _solve_one_problem(problem_name, solvers, labels, feature, max_eval_factor, custom_problem_loader, cutest_problem_options, profile_options):
+def _load_problem(problem_name, custom_problem_loader, cutest_problem_options, project_x0):
     """
-    Solve a given problem.
-
-    If problem_name is an instance of Problem, it is used directly. In this
-    case, the problem options but contain the name of the problem. Otherwise,
-    the problem is loaded from CUTEst.
-
-    Notes
-    -----
-    Do not call this function concurrently with the same CUTEst problem name.
+    Load a given problem, with memoization.
+
+    If problem_name is a tuple, its first element is the name of the problem
+    and its second element is given to the custom problem loader. Otherwise,
+    the problem is loaded from CUTEst. The name of the problem and the problem
+    are returned, or None if the problem cannot be loaded.
+
+    The most recently loaded problems are memoized, so that a problem is not
+    loaded, and its initial point not projected, for every run of every solver,
+    although each of them is a task on its own. The options for loading the
+    CUTEst problems are part of the key of the cache, because they determine
+    whether a problem is valid. They must be given as a tuple of key-value
+    pairs, so that they are hashable. The custom problem loader is not part of
+    the key, because it may not be hashable and it is the same for all the
+    problems of a benchmark. The returned problems must not be modified.
     """
-    # Load the problem and return if it cannot be loaded.
-    set_cutest_problem_options(**cutest_problem_options)
+    key = (problem_name, cutest_problem_options, project_x0)
+    if key in _loaded_problems:
+        # Move the problem to the end of the cache, as it is the most recent.
+        _loaded_problems[key] = _loaded_problems.pop(key)
+        return _loaded_problems[key]
+    if len(_loaded_problems) >= _MAX_LOADED_PROBLEMS:
+        del _loaded_problems[next(iter(_loaded_problems))]
+    _loaded_problems[key] = _load_problem_uncached(problem_name, custom_problem_loader, cutest_problem_options, project_x0)
+    return _loaded_problems[key]
+
+
+def _load_problem_uncached(problem_name, custom_problem_loader, cutest_problem_options, project_x0):
+    """
+    Load a given problem, as described in `_load_problem`.
+    """
+    set_cutest_problem_options(**dict(cutest_problem_options))
     if isinstance(problem_name, tuple):
         problem = custom_problem_loader(problem_name[1])
         problem_name = problem_name[0]
@@ -504,75 +615,109 @@ def _solve_one_problem(problem_name, solvers, labels, feature, max_eval_factor,
             return
 
     # Project the initial point if necessary.
-    if profile_options[ProfileOption.PROJECT_X0]:
+    if project_x0:
         problem.project_x0()
+    return problem_name, problem
+
+
+def _evaluate_initial_point(problem_name, custom_problem_loader, cutest_problem_options, project_x0):
+    """
+    Evaluate the functions of a given problem at its initial point.
+
+    The name of the problem, the objective function value and the maximum
+    constraint violation at the initial point, and the dimension of the problem
+    are returned, or None if the problem cannot be loaded.
+    """
+    loaded_problem = _load_problem(problem_name, custom_problem_loader, cutest_problem_options, project_x0)
+    if loaded_problem is None:
+        return
+    problem_name, problem = loaded_problem
+    return problem_name, problem.fun(problem.x0), problem.maxcv(problem.x0), problem.n
+
+
+def _solve_one_run(problem_name, solvers, solver_n_args, labels, feature, max_eval_factor, custom_problem_loader, cutest_problem_options, project_x0, i_solver, i_run):
+    """
+    Solve a given problem with a given solver for a given run.
 
-    # Evaluate the functions at the initial point.
-    fun_init = problem.fun(problem.x0)
-    maxcv_init = problem.maxcv(problem.x0)
+    The problem must be loadable, as checked by `_evaluate_initial_point`.
+    """
+    problem_name, problem = _load_problem(problem_name, custom_problem_loader, cutest_problem_options, project_x0)
 
-    # Solve the problem with each solver.
+    # Solve the problem.
     time_start = time.monotonic()
-    n_solvers = len(solvers)
     n_runs = feature.options[FeatureOption.N_RUNS]
     max_eval = max_eval_factor * problem.n
-    n_eval = np.zeros((n_solvers, n_runs), dtype=int)
-    fun_histories = np.full((n_solvers, n_runs, max_eval), np.nan)
-    fun_out = np.full((n_solvers, n_runs), np.nan)
-    maxcv_histories = np.full((n_solvers, n_runs, max_eval), np.nan)
-    maxcv_out = np.full((n_solvers, n_runs), np.nan)
+    fun_hist = np.full(max_eval, np.nan)
+    fun_out = np.nan
+    maxcv_hist = np.full(max_eval, np.nan)
+    maxcv_out = np.nan
     logger = get_logger(__name__)
-    for i_solver in range(n_solvers):
-        for i_run in range(n_runs):
-            logger.info(f'Solving {problem_name} with {labels[i_solver]} (run {i_run + 1}/{n_runs}).')
-            time_start_solver_run = time.monotonic()
-            featured_problem = FeaturedProblem(problem, feature, max_eval, i_run)
-            sig = signature(solvers[i_solver])
-            if len(sig.parameters) not in [1, 2, 4, 8, 10]:
-                raise ValueError(f'Unknown signature: {sig}.')
-            with open(os.devnull, 'w') as devnull:
-                with warnings.catch_warnings(), redirect_stdout(devnull), redirect_stderr(devnull):
-                    warnings.filterwarnings('ignore')
-                    try:
-                        if len(sig.parameters) == 1:
-                            x = solvers[i_solver](featured_problem)
-                        elif len(sig.parameters) == 2:
-                            x = solvers[i_solver](featured_problem.fun, featured_problem.x0)
-                        elif len(sig.parameters) == 4:
-                            x = solvers[i_solver](featured_problem.fun, featured_problem.x0, featured_problem.lb, featured_problem.ub)
-                        elif len(sig.parameters) == 8:
-                            x = solvers[i_solver](featured_problem.fun, featured_problem.x0, featured_problem.lb, featured_problem.ub, featured_problem.a_ub, featured_problem.b_ub, featured_problem.a_eq, featured_problem.b_eq)
-                        else:
-                            x = solvers[i_solver](featured_problem.fun, featured_problem.x0, featured_problem.lb, featured_problem.ub, featured_problem.a_ub, featured_problem.b_ub, featured_problem.a_eq, featured_problem.b_eq, featured_problem.c_ub, featured_problem.c_eq)
-                        # FIXME: Permute the x in the 'permuted' feature.
-                        fun_out[i_solver, i_run] = problem.fun(x)
-                        maxcv_out[i_solver, i_run] = problem.maxcv(x)
-                        if featured_problem.type == 'unconstrained':
-                            result = f'f = {fun_out[i_solver, i_run]:.4e}'
-                        else:
-                            result = f'f = {fun_out[i_solver, i_run]:.4e}, maxcv = {maxcv_out[i_solver, i_run]:.4e}'
-                        logger.info(f'Results for {problem_name} with {labels[i_solver]} (run {i_run + 1}/{n_runs}): {result} ({time.monotonic() - time_start_solver_run:.2f} seconds).')
-                    except Exception as exc:
-                        logger.warning(f'An error occurred while solving {problem_name} with {labels[i_solver]}: {exc}.')
-            n_eval[i_solver, i_run] = featured_problem.n_eval
-            fun_histories[i_solver, i_run, :n_eval[i_solver, i_run]] = featured_problem.fun_hist[:n_eval[i_solver, i_run]]
-            maxcv_histories[i_solver, i_run, :n_eval[i_solver, i_run]] = featured_problem.maxcv_hist[:n_eval[i_solver, i_run]]
-            if n_eval[i_solver, i_run] > 0:
-                fun_histories[i_solver, i_run, n_eval[i_solver, i_run]:] = fun_histories[i_solver, i_run, n_eval[i_solver, i_run] - 1]
-                maxcv_histories[i_solver, i_run, n_eval[i_solver, i_run]:] = maxcv_histories[i_solver, i_run, n_eval[i_solver, i_run] - 1]
-    return problem_name, fun_histories, maxcv_histories, fun_out, maxcv_out, fun_init, maxcv_init, n_eval, problem.n, time.monotonic() - time_start
+    logger.info(f'Solving {problem_name} with {labels[i_solver]} (run {i_run + 1}/{n_runs}).')
+    featured_problem = FeaturedProblem(problem, feature, max_eval, i_run)
+    devnull = _get_devnull()
+    with warnings.catch_warnings(), redirect_stdout(devnull), redirect_stderr(devnull):
+        warnings.filterwarnings('ignore')
+        try:
+            if solver_n_args[i_solver] == 1:
+                x = solvers[i_solver](featured_problem)
+            elif solver_n_args[i_solver] == 2:
+                x = solvers[i_solver](featured_problem.fun, featured_problem.x0)
+            elif solver_n_args[i_solver] == 4:
+                x = solvers[i_solver](featured_problem.fun, featured_problem.x0, featured_problem.lb, featured_problem.ub)
+            elif solver_n_args[i_solver] == 8:
+                x = solvers[i_solver](featured_problem.fun, featured_problem.x0, featured_problem.lb, featured_problem.ub, featured_problem.a_ub, featured_problem.b_ub, featured_problem.a_eq, featured_problem.b_eq)
+            else:
+                x = solvers[i_solver](featured_problem.fun, featured_problem.x0, featured_problem.lb, featured_problem.ub, featured_problem.a_ub, featured_problem.b_ub, featured_problem.a_eq, featured_problem.b_eq, featured_problem.c_ub, featured_problem.c_eq)
+            # FIXME: Permute the x in the 'permuted' feature.
+            fun_out = problem.fun(x)
+            maxcv_out = problem.maxcv(x)
+            if featured_problem.type == 'unconstrained':
+                result = f'f = {fun_out:.4e}'
+            else:
+                result = f'f = {fun_out:.4e}, maxcv = {maxcv_out:.4e}'
+            logger.info(f'Results for {problem_name} with {labels[i_solver]} (run {i_run + 1}/{n_runs}): {result} ({time.monotonic() - time_start:.2f} seconds).')
+        except Exception as exc:
+            logger.warning(f'An error occurred while solving {problem_name} with {labels[i_solver]}: {exc}.')
+    n_eval = featured_problem.n_eval
+    fun_hist[:n_eval] = featured_problem.fun_hist[:n_eval]
+    maxcv_hist[:n_eval] = featured_problem.maxcv_hist[:n_eval]
+    if n_eval > 0:
+        fun_hist[n_eval:] = fun_hist[n_eval - 1]
+        maxcv_hist[n_eval:] = maxcv_hist[n_eval - 1]
+    return fun_hist, maxcv_hist, fun_out, maxcv_out, n_eval, time.monotonic() - time_start
+
+
+@lru_cache(maxsize=None)
+def _get_devnull():
+    """
+    Open the null device, only once per process.
+
+    The outputs of the solvers are redirected to the returned file, which is
+    closed when the process terminates.
+    """
+    devnull = open(os.devnull, 'w')
+    atexit.register(devnull.close)
+    return devnull
 
 
 def _compute_merit_values(fun_values, maxcv_values, maxcv_init):
     """
     Compute the merit function values.
+
+    The leading dimensions of the function and constraint violation values must
+    match the dimensions of the initial constraint violations.
     """
-    maxcv_init = maxcv_init[(...,) + (np.newaxis,) * (fun_values.ndim - 1)]
+    maxcv_init = np.reshape(maxcv_init, np.shape(maxcv_init) + (1,) * (fun_values.ndim - np.ndim(maxcv_init)))
     infeasibility_thresholds = np.maximum(1e-5, maxcv_init)
+    merit_values = np.nan_to_num(fun_values, nan=np.inf, posinf=np.inf, neginf=-np.inf)
     is_infeasible = maxcv_values > infeasibility_thresholds
-    is_almost_feasible = (1e-10 < maxcv_values) & (maxcv_values <= infeasibility_thresholds)
-    merit_values = np.copy(fun_values)
-    merit_values[is_infeasible | np.isnan(merit_values)] = np.inf
+    merit_values[is_infeasible] = np.inf
+
+    # The mask of the infeasible points is reused for the almost feasible ones,
+    # to avoid allocating temporary arrays. It is not negated, because both
+    # comparisons are false if the infeasibility thresholds are NaN.
+    is_almost_feasible = np.less_equal(maxcv_values, infeasibility_thresholds, out=is_infeasible)
+    np.greater(maxcv_values, 1e-10, out=is_almost_feasible, where=is_almost_feasible)
     merit_values[is_almost_feasible] += 1e5 * maxcv_values[is_almost_feasible]
     return merit_values
 
@@ -581,13 +726,18 @@ def _format_float_scientific_latex(x):
     """
     Format a floating-point number as scientific notation in LaTeX.
     """
-    raw = np.format_float_scientific(x, trim='-', exp_digits=0)
-    match = re.compile(r'^(?P<coefficient>[0-9]+(\.[0-9]+)?)e(?P<exponent>(-)?[0-9]+)$').match(raw)
-    if not match:
+    if not np.isfinite(x):
         raise ValueError(f'Cannot format {x} as scientific notation.')
-    if match.group('coefficient') == '1':
-        return raw, f'10^{{{match.group("exponent")}}}'
-    return raw, f'{match.group("coefficient")} \\times 10^{{{match.group("exponent")}}}'
+
+    # The coefficient is rounded to 15 significant digits, so that the
+    # rounding errors in the tolerances do not appear in the labels.
+    coefficient, exponent = f'{x:.14e}'.split('e')
+    coefficient = coefficient.rstrip('0').rstrip('.')
+    exponent = int(exponent)
+    raw = f'{coefficient}e{exponent}'
+    if coefficient == '1':
+        return raw, f'10^{{{exponent}}}'
+    return raw, f'{coefficient} \\times 10^{{{exponent}}}'
 
 
 def _draw_profiles(work_hist, work_out, problem_dimensions, labels, tolerance_label, i_tolerance, ax_summary_hist, ax_summary_out):
@@ -678,20 +828,17 @@ def _draw_profiles(work_hist, work_out, problem_dimensions, labels, tolerance_la
 def _draw_performance_data_profiles(ax, x, y, labels=None):
     n_solvers = x.shape[1]
     n_runs = y.shape[2]
-    y_mean = np.mean(y, 2)
-    y_min = np.min(y, 2)
-    y_max = np.max(y, 2)
+
+    # Build the stairs of all the solvers at once.
+    x_stairs = np.repeat(x, 2, 0)[1:]
+    y_mean_stairs, y_min_stairs, y_max_stairs = np.repeat(np.stack([np.mean(y, 2), np.min(y, 2), np.max(y, 2)]), 2, 1)[:, :-1]
     for i_solver in range(n_solvers):
-        x_stairs = np.repeat(x[:, i_solver], 2)[1:]
-        y_mean_stairs = np.repeat(y_mean[:, i_solver], 2)[:-1]
-        y_min_stairs = np.repeat(y_min[:, i_solver], 2)[:-1]
-        y_max_stairs = np.repeat(y_max[:, i_solver], 2)[:-1]
         if labels is not None:
-            ax.plot(x_stairs, y_mean_stairs, label=labels[i_solver])
+            ax.plot(x_stairs[:, i_solver], y_mean_stairs[:, i_solver], label=labels[i_solver])
         else:
-            ax.plot(x_stairs, y_mean_stairs)
+            ax.plot(x_stairs[:, i_solver], y_mean_stairs[:, i_solver])
         if n_runs > 1:
-            ax.fill_between(x_stairs, y_min_stairs, y_max_stairs, alpha=0.2)
+            ax.fill_between(x_stairs[:, i_solver], y_min_stairs[:, i_solver], y_max_stairs[:, i_solver], alpha=0.2)
     ax.xaxis.set_major_locator(MaxNLocator(5, integer=True))
     ax.yaxis.set_ticks_position('both')
     ax.yaxis.set_major_locator(MaxNLocator(5, prune='lower'))
@@ -727,35 +874,49 @@ def _draw_log_ratio_profiles(ax, work, labels):
 
 
 def _get_extended_performances_data_profile_axes(work, problem_dimensions):
-    n_problems, n_solvers, n_runs = work.shape
-    x_perf, y_perf, ratio_max_perf = _get_performance_data_profile_axes(work, lambda i_problem, i_run: np.nanmin(work[i_problem, :, i_run], initial=np.inf))
+    x_perf, y_perf, ratio_max_perf = _get_performance_data_profile_axes(work, np.nanmin(work, 1, initial=np.inf))
     x_perf[np.isinf(x_perf)] = ratio_max_perf ** 2.0
-    x_perf = np.vstack([np.ones((1, n_solvers)), x_perf])
-    y_perf = np.vstack([np.zeros((1, n_solvers, n_runs)), y_perf])
-    if n_problems > 0:
-        x_perf = np.vstack([x_perf, np.full((1, n_solvers), ratio_max_perf ** 2.0)])
-        y_perf = np.vstack([y_perf, y_perf[-1, np.newaxis, :, :]])
-    x_data, y_data, ratio_max_data = _get_performance_data_profile_axes(work, lambda i_problem, i_run: problem_dimensions[i_problem] + 1)
+    x_perf, y_perf = _extend_profile_axes(x_perf, y_perf, 1.0, ratio_max_perf ** 2.0)
+    x_data, y_data, ratio_max_data = _get_performance_data_profile_axes(work, (problem_dimensions + 1)[:, np.newaxis])
     x_data[np.isinf(x_data)] = ratio_max_data ** 2.0 - 1.0
-    x_data = np.vstack([np.zeros((1, n_solvers)), x_data])
-    y_data = np.vstack([np.zeros((1, n_solvers, n_runs)), y_data])
-    if n_problems > 0:
-        x_data = np.vstack([x_data, np.full((1, n_solvers), ratio_max_data ** 2.0 - 1.0)])
-        y_data = np.vstack([y_data, y_data[-1, np.newaxis, :, :]])
+    x_data, y_data = _extend_profile_axes(x_data, y_data, 0.0, ratio_max_data ** 2.0 - 1.0)
     return x_perf, y_perf, ratio_max_perf, x_data, y_data, ratio_max_data
 
 
-def _get_performance_data_profile_axes(work, denominator):
+def _extend_profile_axes(x, y, x_first, x_last):
+    """
+    Extend the axes of a profile.
+
+    The profile is extended with a first point at `x_first` where the profile
+    vanishes and, if the profile is not empty, with a last point at `x_last`
+    where the profile keeps its last value. The extended axes are preallocated
+    to avoid copying them several times.
+    """
+    n_points, n_solvers, n_runs = y.shape
+    n_points_extended = n_points + 2 if n_points > 0 else 1
+    x_extended = np.empty((n_points_extended, n_solvers))
+    y_extended = np.empty((n_points_extended, n_solvers, n_runs))
+    x_extended[0] = x_first
+    y_extended[0] = 0.0
+    x_extended[1:n_points + 1] = x
+    y_extended[1:n_points + 1] = y
+    if n_points > 0:
+        x_extended[-1] = x_last
+        y_extended[-1] = y[-1]
+    return x_extended, y_extended
+
+
+def _get_performance_data_profile_axes(work, denominators):
     """
     Calculate the axes of the performance and data profiles.
+
+    The array `denominators` must be broadcastable to the shape
+    ``(n_problems, n_runs)``.
     """
     n_problems, n_solvers, n_runs = work.shape
 
     # Calculate the x-axis values.
-    x = np.full((n_runs, n_problems, n_solvers), np.nan)
-    for i_run in range(n_runs):
-        for i_problem in range(n_problems):
-            x[i_run, i_problem, :] = work[i_problem, :, i_run] / denominator(i_problem, i_run)
+    x = np.transpose(work / denominators[:, np.newaxis, :], (2, 0, 1))
     ratio_max = np.nanmax(x, initial=np.finfo(float).eps)
     x[np.isnan(x)] = np.inf
     x = np.sort(x, 1)
@@ -763,16 +924,17 @@ def _get_performance_data_profile_axes(work, denominator):
     sort_x = np.argsort(x, 0, 'stable')
     x = np.take_along_axis(x, sort_x, 0)
 
-    # Calculate the y-axis values.
+    # Calculate the y-axis values. The values of the i-th run are first stored
+    # in the i-th block of rows of the i-th slice, and then sorted as x.
     y = np.full((n_problems * n_runs, n_solvers, n_runs), np.nan)
-    for i_solver in range(n_solvers):
-        for i_run in range(n_runs):
-            if n_problems > 0:
-                y[i_run * n_problems:(i_run + 1) * n_problems, i_solver, i_run] = np.linspace(1 / n_problems, 1.0, n_problems)
-                y[:, i_solver, i_run] = np.take_along_axis(y[:, i_solver, i_run], sort_x[:, i_solver], 0)
-            for i_problem in range(n_problems * n_runs):
-                if np.isnan(y[i_problem, i_solver, i_run]):
-                    y[i_problem, i_solver, i_run] = y[i_problem - 1, i_solver, i_run] if i_problem > 0 else 0.0
+    if n_problems > 0:
+        y_blocks = np.reshape(y, (n_runs, n_problems, n_solvers, n_runs))
+        y_blocks[np.arange(n_runs), :, :, np.arange(n_runs)] = np.linspace(1 / n_problems, 1.0, n_problems)[np.newaxis, :, np.newaxis]
+        y = np.take_along_axis(y, sort_x[:, :, np.newaxis], 0)
+
+    # Fill the missing values with the previous ones. Since the x-axis values
+    # of each run are sorted, the nonmissing y-axis values are nondecreasing.
+    y = np.maximum.accumulate(np.nan_to_num(y, nan=0.0), 0)
     return x, y, ratio_max
 
 
@@ -788,3 +950,13 @@ def _data_formatter(x, _):
         return str(int(2 ** x - 1))
     else:
         return f'$2^{{{f"{x:.8f}".rstrip("0").rstrip(".")}}}-1$'
+
+
+# Names of the options that can be given as keyword arguments to run_benchmark.
+_FEATURE_OPTIONS = frozenset(option.value for option in FeatureOption)
+_PROFILE_OPTIONS = frozenset(option.value for option in ProfileOption)
+
+# Problems loaded in the current process by _load_problem, from the least to the
+# most recently used, and the maximum number of them that are kept alive.
+_loaded_problems = {}
+_MAX_LOADED_PROBLEMS = 16
@@ -27,6 +27,7 @@ class ProfileOption(str, Enum):
     N_JOBS = 'n_jobs'
     BENCHMARK_ID = 'benchmark_id'
     PROJECT_X0 = 'project_x0'
+    PLAIN_COMPARE_POLICY = 'plain_compare_policy'
 
 
 class CUTEstProblemOption(str, Enum):